@@ -1,16 +1,260 @@
 """System information tool."""
 
+import asyncio
+import atexit
 import os
 import platform
 import shutil
-from typing import Any
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Callable
 
 from nanobot.agent.tools.base import Tool
 
+# Resolved once: platform.system()/uname() are not free (on Windows the first
+# call spawns a subprocess), and none of this changes during the process.
+_IS_WINDOWS = sys.platform == "win32"
+_IS_LINUX = sys.platform.startswith("linux")
+_IS_DARWIN = sys.platform == "darwin"
+# os.uname() is a single syscall; platform.uname() is only needed on Windows
+_UNAME_RESULT = os.uname() if hasattr(os, "uname") else None
+
+_VALID_INFO_TYPES = frozenset(("all", "os", "cpu", "memory", "disk"))
+
+_OS_HDR = "=== OS Information ==="
+_CPU_HDR = "=== CPU Information ==="
+_MEM_HDR = "=== Memory Information ==="
+_DISK_HDR = "=== Disk Information ==="
+
+# Whole-section templates, filled with a single format_map() call
+_ALL_TEMPLATE = "=== System Information ===\n\n{os}\n\n{cpu}\n\n{memory}\n\n{disk}"
+_MEM_TEMPLATE = (
+    _MEM_HDR + "\n"
+    "Total: {total:.2f} GB\n"
+    "Used: {used:.2f} GB\n"
+    "Available: {avail:.2f} GB\n"
+    "Usage: {percent:.1f}%"
+)
+
+_libc = None
+if _IS_DARWIN:
+    import ctypes
+    import subprocess
+
+    try:
+        _libc = ctypes.CDLL("libc.dylib", use_errno=True)
+        _libc.sysctlbyname.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_size_t),
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+        ]
+        _libc.sysctlbyname.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc = None
+elif _IS_WINDOWS:
+    import ctypes
+
+    class _MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    # Private WinDLL handle so setting argtypes doesn't leak into ctypes.windll
+    _GlobalMemoryStatusEx = ctypes.WinDLL("kernel32", use_last_error=True).GlobalMemoryStatusEx
+    _GlobalMemoryStatusEx.argtypes = [ctypes.POINTER(_MEMORYSTATUSEX)]
+    _GlobalMemoryStatusEx.restype = ctypes.c_int
+
+
+def _sysctl_raw(name: bytes) -> bytes:
+    """Read a sysctl value via sysctlbyname(3) without spawning `sysctl`."""
+    if _libc is None:
+        raise OSError(f"sysctlbyname unavailable for {name.decode()}")
+    size = ctypes.c_size_t(0)
+    if _libc.sysctlbyname(name, None, ctypes.byref(size), None, 0) != 0:
+        raise OSError(ctypes.get_errno(), f"sysctlbyname({name.decode()}) failed")
+    buf = ctypes.create_string_buffer(size.value)
+    if _libc.sysctlbyname(name, buf, ctypes.byref(size), None, 0) != 0:
+        raise OSError(ctypes.get_errno(), f"sysctlbyname({name.decode()}) failed")
+    return buf.raw[:size.value]
+
+
+def _sysctl_str(name: bytes) -> str:
+    return _sysctl_raw(name).rstrip(b"\0").decode(errors="replace")
+
+
+def _sysctl_int(name: bytes) -> int:
+    return int.from_bytes(_sysctl_raw(name), sys.byteorder)
+
+
+def _slurp_proc(path: str, size: int = 8192) -> bytes:
+    """Read a procfs file with a single read() so the snapshot is consistent."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+# Nothing in nanobot chdir()s, so resolve the directory reported on once
+try:
+    _INITIAL_CWD: str | None = os.getcwd()
+except OSError:
+    _INITIAL_CWD = None
+
+# /proc/meminfo is re-read on every memory query, so keep one fd open and
+# pread() it from offset 0 (procfs regenerates the content on each read)
+_MEMINFO_FD = None
+if _IS_LINUX:
+    try:
+        _MEMINFO_FD = os.open("/proc/meminfo", os.O_RDONLY)
+        atexit.register(os.close, _MEMINFO_FD)
+    except OSError:
+        _MEMINFO_FD = None
+
+
+def _read_meminfo() -> bytes:
+    """Snapshot /proc/meminfo, reusing the long-lived fd when available."""
+    if _MEMINFO_FD is not None:
+        return os.pread(_MEMINFO_FD, 8192, 0)
+    return _slurp_proc("/proc/meminfo")
+
+
+def _probe_meminfo_sync() -> bool:
+    """Whether a /proc/meminfo read is cheap enough to skip the thread hop."""
+    if not _IS_LINUX:
+        return False
+    try:
+        start = time.perf_counter_ns()
+        _read_meminfo()
+        return time.perf_counter_ns() - start < 200_000
+    except OSError:
+        return False
+
+
+# Dispatching to a worker thread costs tens of microseconds, more than a
+# warm procfs read; read memory inline when the probe says it is that cheap
+_MEMINFO_SYNC = _probe_meminfo_sync()
+
+
+@lru_cache(maxsize=1)
+def _os_info_cached() -> str:
+    """OS description; static for the lifetime of the process."""
+    if _UNAME_RESULT is None:
+        uname = platform.uname()
+        return "\n".join([
+            _OS_HDR,
+            f"System: {uname.system}",
+            f"Release: {uname.release}",
+            f"Version: {uname.version}",
+            f"Machine: {uname.machine}",
+            f"Processor: {uname.processor}",
+        ])
+    
+    # platform.processor() would fork `uname -p`, which is usually empty or
+    # the machine type on Linux; the CPU section carries the model instead
+    lines = [
+        _OS_HDR,
+        f"System: {_UNAME_RESULT.sysname}",
+        f"Release: {_UNAME_RESULT.release}",
+        f"Version: {_UNAME_RESULT.version}",
+        f"Machine: {_UNAME_RESULT.machine}",
+    ]
+    if _IS_LINUX:
+        try:
+            product = _slurp_proc("/sys/devices/virtual/dmi/id/product_name", 256)
+            product = product.strip().decode(errors="replace")
+            if product:
+                lines.append(f"Product: {product}")
+        except OSError:
+            pass
+    return "\n".join(lines)
+
+
+def _format_memory(total: int, avail: int) -> str:
+    """Render the memory section from total and available bytes."""
+    used = total - avail
+    return _MEM_TEMPLATE.format_map({
+        "total": total / (1024**3),
+        "used": used / (1024**3),
+        "avail": avail / (1024**3),
+        "percent": (used / total * 100) if total > 0 else 0,
+    })
+
+
+@lru_cache(maxsize=1)
+def _cpu_model_cached() -> str:
+    """CPU model name, or an empty string if it cannot be determined."""
+    try:
+        if _IS_LINUX:
+            # cpuinfo grows per core; the first processor block fits in 4KB
+            buf = _slurp_proc("/proc/cpuinfo", 4096)
+            idx = buf.find(b"model name")
+            if idx != -1:
+                value = buf[idx:].split(b":", 1)[1].split(b"\n", 1)[0]
+                return value.strip().decode(errors="replace")
+        elif _IS_DARWIN:  # macOS
+            try:
+                return _sysctl_str(b"machdep.cpu.brand_string")
+            except OSError:
+                pass
+            result = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
+            if result.returncode == 0:
+                return result.stdout.strip()
+    except Exception:
+        pass
+    return ""
+
+
+class _TtlCache:
+    """Holds a single computed value for ``ttl`` seconds."""
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.t = 0.0
+        self.v: str | None = None
+    
+    def get(self, compute: Callable[[], str]) -> str:
+        now = time.monotonic()
+        if self.v is not None and now - self.t < self.ttl:
+            return self.v
+        result = compute()
+        self.t, self.v = now, result
+        return result
+
 
 class SystemInfoTool(Tool):
     """Tool to get system information (CPU, memory, disk, OS)."""
     
+    def __init__(self, cache_ttl: float = 0.25, working_dir: str | None = None):
+        self.working_dir = working_dir
+        # OS/CPU model are cached for the process lifetime; usage figures
+        # only briefly, so bursts of calls within one tick share a reading
+        self._memory_cache = _TtlCache(cache_ttl)
+        self._disk_cache = _TtlCache(cache_ttl)
+        # Section getters in 'all' output order; each is blocking and runs in a thread
+        self._dispatch = {
+            "os": self._get_os_info,
+            "cpu": self._get_cpu_info,
+            "memory": self._get_memory_info,
+            "disk": self._get_disk_info,
+        }
+    
     @property
     def name(self) -> str:
         return "system_info"
@@ -36,157 +280,99 @@ class SystemInfoTool(Tool):
     async def execute(self, info_type: str = "all", **kwargs: Any) -> str:
         """Get system information."""
         try:
-            info_type = info_type.lower() if info_type else "all"
+            key = (info_type or "all").lower()
+            if key not in _VALID_INFO_TYPES:
+                return f"Error: Unknown info_type '{info_type}'. Use: all, os, cpu, memory, or disk"
             
-            if info_type == "all":
-                return self._get_all_info()
-            elif info_type == "os":
-                return self._get_os_info()
-            elif info_type == "cpu":
-                return self._get_cpu_info()
-            elif info_type == "memory":
+            if key == "all":
+                return await self._get_all_info()
+            if key == "memory" and _MEMINFO_SYNC:
                 return self._get_memory_info()
-            elif info_type == "disk":
-                return self._get_disk_info()
-            else:
-                return f"Error: Unknown info_type '{info_type}'. Use: all, os, cpu, memory, or disk"
+            return await asyncio.to_thread(self._dispatch[key])
         except Exception as e:
             return f"Error getting system info: {str(e)}"
     
-    def _get_all_info(self) -> str:
-        """Get all system information."""
-        parts = [
-            "=== System Information ===",
-            "",
-            self._get_os_info(),
-            "",
-            self._get_cpu_info(),
-            "",
-            self._get_memory_info(),
-            "",
-            self._get_disk_info(),
-        ]
-        return "\n".join(parts)
+    async def _get_all_info(self) -> str:
+        """Get all system information, probing each section concurrently."""
+        sections = await asyncio.gather(
+            *(asyncio.to_thread(handler) for handler in self._dispatch.values())
+        )
+        return _ALL_TEMPLATE.format_map(dict(zip(self._dispatch, sections)))
     
     def _get_os_info(self) -> str:
         """Get operating system information."""
-        system = platform.system()
-        release = platform.release()
-        version = platform.version()
-        machine = platform.machine()
-        processor = platform.processor()
-        
-        return f"""=== OS Information ===
-System: {system}
-Release: {release}
-Version: {version}
-Machine: {machine}
-Processor: {processor}"""
+        return _os_info_cached()
     
     def _get_cpu_info(self) -> str:
         """Get CPU information."""
         try:
-            cpu_count = os.cpu_count() or "Unknown"
-            cpu_count_physical = getattr(os, 'cpu_count', lambda: None)()
-            
-            # Try to get CPU frequency (platform dependent)
-            freq_info = ""
-            try:
-                if platform.system() == "Linux":
-                    with open("/proc/cpuinfo", "r") as f:
-                        for line in f:
-                            if "model name" in line.lower():
-                                freq_info = line.split(":")[-1].strip()
-                                break
-                elif platform.system() == "Darwin":  # macOS
-                    import subprocess
-                    result = subprocess.run(
-                        ["sysctl", "-n", "machdep.cpu.brand_string"],
-                        capture_output=True,
-                        text=True,
-                        timeout=2
-                    )
-                    if result.returncode == 0:
-                        freq_info = result.stdout.strip()
-            except Exception:
-                pass
-            
-            info = f"""=== CPU Information ===
-CPU Count (logical): {cpu_count}"""
+            if _IS_LINUX:
+                # CPUs this process may run on, which honours cgroup/taskset limits
+                cpu_count = len(os.sched_getaffinity(0))
+            else:
+                cpu_count = os.cpu_count() or "Unknown"
+            freq_info = _cpu_model_cached()
             
+            lines = [_CPU_HDR, f"CPU Count (logical): {cpu_count}"]
             if freq_info:
-                info += f"\nCPU Model: {freq_info}"
-            
-            return info
+                lines.append(f"CPU Model: {freq_info}")
+            return "\n".join(lines)
         except Exception as e:
-            return f"=== CPU Information ===\nError: {str(e)}"
+            return f"{_CPU_HDR}\nError: {str(e)}"
     
     def _get_memory_info(self) -> str:
         """Get memory information."""
+        return self._memory_cache.get(self._read_memory_info)
+    
+    def _read_memory_info(self) -> str:
+        """Read current memory usage."""
         try:
             # Use shutil for disk space, but for memory we need platform-specific methods
             # For simplicity, we'll use a cross-platform approach
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 try:
-                    import ctypes
-                    class MEMORYSTATUSEX(ctypes.Structure):
-                        _fields_ = [
-                            ("dwLength", ctypes.c_ulong),
-                            ("dwMemoryLoad", ctypes.c_ulong),
-                            ("ullTotalPhys", ctypes.c_ulonglong),
-                            ("ullAvailPhys", ctypes.c_ulonglong),
-                            ("ullTotalPageFile", ctypes.c_ulonglong),
-                            ("ullAvailPageFile", ctypes.c_ulonglong),
-                            ("ullTotalVirtual", ctypes.c_ulonglong),
-                            ("ullAvailVirtual", ctypes.c_ulonglong),
-                            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
-                        ]
-                    
-                    mem_status = MEMORYSTATUSEX()
-                    mem_status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
-                    ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(mem_status))
+                    mem_status = _MEMORYSTATUSEX()
+                    mem_status.dwLength = ctypes.sizeof(_MEMORYSTATUSEX)
+                    if not _GlobalMemoryStatusEx(ctypes.byref(mem_status)):
+                        raise ctypes.WinError(ctypes.get_last_error())
                     
-                    total_gb = mem_status.ullTotalPhys / (1024**3)
-                    avail_gb = mem_status.ullAvailPhys / (1024**3)
-                    used_gb = total_gb - avail_gb
-                    percent = (used_gb / total_gb * 100) if total_gb > 0 else 0
-                    
-                    return f"""=== Memory Information ===
-Total: {total_gb:.2f} GB
-Used: {used_gb:.2f} GB
-Available: {avail_gb:.2f} GB
-Usage: {percent:.1f}%"""
+                    return _format_memory(mem_status.ullTotalPhys, mem_status.ullAvailPhys)
                 except Exception:
-                    return "=== Memory Information ===\nUnable to retrieve memory info on Windows"
+                    return f"{_MEM_HDR}\nUnable to retrieve memory info on Windows"
             else:
                 # Linux/macOS - try /proc/meminfo or vm_stat
                 try:
-                    if platform.system() == "Linux":
-                        with open("/proc/meminfo", "r") as f:
-                            meminfo = {}
-                            for line in f:
-                                parts = line.split()
-                                if len(parts) >= 2:
-                                    key = parts[0].rstrip(":")
-                                    value = int(parts[1])
-                                    meminfo[key] = value
-                        
-                        total_kb = meminfo.get("MemTotal", 0)
-                        avail_kb = meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
-                        used_kb = total_kb - avail_kb
+                    if _IS_LINUX:
+                        # Only three keys are needed and they lead the file
+                        total_kb = free_kb = 0
+                        avail_kb = None
+                        found = 0
+                        for line in _read_meminfo().splitlines():
+                            if line.startswith(b"MemTotal:"):
+                                total_kb = int(line.split()[1])
+                            elif line.startswith(b"MemAvailable:"):
+                                avail_kb = int(line.split()[1])
+                            elif line.startswith(b"MemFree:"):
+                                free_kb = int(line.split()[1])
+                            else:
+                                continue
+                            found += 1
+                            if found == 3:
+                                break
                         
-                        total_gb = total_kb / (1024**2)
-                        used_gb = used_kb / (1024**2)
-                        avail_gb = avail_kb / (1024**2)
-                        percent = (used_kb / total_kb * 100) if total_kb > 0 else 0
+                        if avail_kb is None:  # kernels older than 3.14
+                            avail_kb = free_kb
+                        return _format_memory(total_kb * 1024, avail_kb * 1024)
+                    elif _IS_DARWIN:  # macOS
+                        try:
+                            total = _sysctl_int(b"hw.memsize")
+                            # Free pages only; vm_stat's inactive/speculative
+                            # pages would need host_statistics64()
+                            avail = _sysctl_int(b"vm.page_free_count") * _sysctl_int(b"hw.pagesize")
+                            return _format_memory(total, avail)
+                        except OSError:
+                            pass
                         
-                        return f"""=== Memory Information ===
-Total: {total_gb:.2f} GB
-Used: {used_gb:.2f} GB
-Available: {avail_gb:.2f} GB
-Usage: {percent:.1f}%"""
-                    else:  # macOS
-                        import subprocess
                         result = subprocess.run(
                             ["vm_stat"],
                             capture_output=True,
@@ -195,24 +381,35 @@ Usage: {percent:.1f}%"""
                         )
                         if result.returncode == 0:
                             # Parse vm_stat output (simplified)
-                            return f"""=== Memory Information ===
-{result.stdout[:500]}"""
+                            return f"{_MEM_HDR}\n{result.stdout[:500]}"
                         else:
-                            return "=== Memory Information ===\nUnable to retrieve memory info"
+                            return f"{_MEM_HDR}\nUnable to retrieve memory info"
+                    else:
+                        return f"{_MEM_HDR}\nUnable to retrieve memory info"
                 except Exception as e:
-                    return f"=== Memory Information ===\nError: {str(e)}"
+                    return f"{_MEM_HDR}\nError: {str(e)}"
         except Exception as e:
-            return f"=== Memory Information ===\nError: {str(e)}"
+            return f"{_MEM_HDR}\nError: {str(e)}"
     
     def _get_disk_info(self) -> str:
         """Get disk space information."""
+        return self._disk_cache.get(self._read_disk_info)
+    
+    def _read_disk_info(self) -> str:
+        """Read current disk usage."""
         try:
-            parts = []
-            parts.append("=== Disk Information ===")
+            parts = [_DISK_HDR]
             
-            # Get current working directory disk usage
-            cwd = os.getcwd()
-            total, used, free = shutil.disk_usage(cwd)
+            # Get working directory disk usage
+            cwd = self.working_dir or _INITIAL_CWD or os.getcwd()
+            if _IS_WINDOWS:
+                total, used, free = shutil.disk_usage(cwd)
+            else:
+                # Same arithmetic as shutil.disk_usage, minus the wrapper
+                st = os.statvfs(cwd)
+                total = st.f_blocks * st.f_frsize
+                used = (st.f_blocks - st.f_bfree) * st.f_frsize
+                free = st.f_bavail * st.f_frsize
             
             total_gb = total / (1024**3)
             used_gb = used / (1024**3)
@@ -225,7 +422,7 @@ Usage: {percent:.1f}%"""
             parts.append(f"Free: {free_gb:.2f} GB")
             
             # On Windows, also show C: drive
-            if platform.system() == "Windows":
+            if _IS_WINDOWS:
                 try:
                     total_c, used_c, free_c = shutil.disk_usage("C:\\")
                     total_c_gb = total_c / (1024**3)
@@ -243,4 +440,4 @@ Usage: {percent:.1f}%"""
             
             return "\n".join(parts)
         except Exception as e:
-            return f"=== Disk Information ===\nError: {str(e)}"
+            return f"{_DISK_HDR}\nError: {str(e)}"
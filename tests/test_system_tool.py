@@ -112,3 +112,17 @@ def test_system_info_tool_validate_params() -> None:
     errors = tool.validate_params({"info_type": 123})
     assert len(errors) > 0
     assert "should be string" in errors[0]
+
+
+def test_system_info_tool_usage_cache() -> None:
+    """Test memory/disk usage is reused within the cache TTL."""
+    tool = SystemInfoTool(cache_ttl=60)
+    calls = []
+    tool._read_disk_info = lambda: calls.append(1) or "=== Disk Information ==="
+    
+    assert tool._get_disk_info() == tool._get_disk_info()
+    assert len(calls) == 1
+    
+    tool._disk_cache.ttl = 0
+    tool._get_disk_info()
+    assert len(calls) == 2